@@ -3,7 +3,7 @@ from pathlib import Path
 from typing import Any
 
 import yaml
-from pydantic import BaseModel, ValidationError, model_validator
+from pydantic import BaseModel, Field, ValidationError, model_validator
 from pydantic_core import ErrorDetails
 from pydantic_settings import (
     BaseSettings,
@@ -104,6 +104,8 @@ class RuntimeSettings(BaseModel, extra="forbid"):
 
     subprocess_timeout: int = 3600
     concurrency_limit: int = 5
+    # gzip level of the source archives created from git repositories
+    archive_compression_level: int = Field(default=6, ge=0, le=9)
 
 
 class Config(BaseSettings):
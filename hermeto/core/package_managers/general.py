@@ -23,13 +23,16 @@ pkg_requests_session = get_requests_session(retry_options={"allowed_methods": SA
 
 log = logging.getLogger(__name__)
 
+# Large enough to keep the per-chunk Python overhead negligible for big archives
+DEFAULT_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 def download_binary_file(
     url: str,
     download_path: StrPath,
     auth: AuthBase | None = None,
     insecure: bool = False,
-    chunk_size: int = 8192,
+    chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
 ) -> None:
     """
     Download a binary file (such as a TAR archive) from a URL.
@@ -61,7 +64,7 @@ async def _async_download_binary_file(
     download_path: StrPath,
     auth: aiohttp.BasicAuth | None = None,
     ssl_context: ssl.SSLContext | None = None,
-    chunk_size: int = 8192,
+    chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
 ) -> None:
     """
     Download a binary file (such as a TAR archive) from a URL using asyncio.
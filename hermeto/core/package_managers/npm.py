@@ -5,6 +5,7 @@ import functools
 import json
 import logging
 import os.path
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Literal, NewType, TypedDict
 from urllib.parse import urlparse
@@ -496,6 +497,7 @@ def _get_npm_dependencies(
     :return: Dictionary of Resolved URL dependencies with downloaded paths
     """
     files_to_download: dict[str, dict[str, Any]] = {}
+    git_urls: list[NormalizedUrl] = []
     download_paths = {}
     for url, info in deps_to_download.items():
         url = _normalize_resolved_url(url)
@@ -504,7 +506,7 @@ def _get_npm_dependencies(
         if dep_type == "file":
             continue
         elif dep_type == "git":
-            download_paths[url] = _clone_repo_pack_archive(url, download_dir)
+            git_urls.append(url)
         else:
             if dep_type == "registry":
                 archive_name = f"{info['name']}-{info['version']}.tgz".removeprefix("@").replace(
@@ -536,13 +538,23 @@ def _get_npm_dependencies(
                 "integrity": info["integrity"],
             }
 
-    # Asynchronously download tar files
-    asyncio.run(
-        async_download_files(
-            {url: item["download_path"] for (url, item) in files_to_download.items()},
-            get_config().runtime.concurrency_limit,
+    concurrency_limit = get_config().runtime.concurrency_limit
+    with ThreadPoolExecutor(max_workers=concurrency_limit) as executor:
+        # Clone git repositories in the background while the tar files are being downloaded
+        git_clones = {
+            url: executor.submit(_clone_repo_pack_archive, url, download_dir) for url in git_urls
+        }
+        # Asynchronously download tar files
+        asyncio.run(
+            async_download_files(
+                {url: item["download_path"] for (url, item) in files_to_download.items()},
+                concurrency_limit,
+            )
         )
-    )
+
+    for url, git_clone in git_clones.items():
+        download_paths[url] = git_clone.result()
+
     # Check integrity of downloaded packages
     for url, item in files_to_download.items():
         if item["integrity"]:
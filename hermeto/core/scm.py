@@ -13,11 +13,18 @@ from git.exc import InvalidGitRepositoryError, NoSuchPathError
 from git.repo import Repo
 
 from hermeto import APP_NAME
+from hermeto.core.config import get_config
 from hermeto.core.errors import FetchError, NotAGitRepo, UnsupportedFeature
 from hermeto.core.type_aliases import StrPath
 
 log = logging.getLogger(__name__)
 
+# Don't allow git to prompt for a username if we don't have access
+_GIT_CLONE_ENV = {"GIT_TERMINAL_PROMPT": "0"}
+_COMMIT_ID_RE = re.compile(r"[0-9a-f]{40}")
+# Copy file contents into the archive in 1 MiB chunks instead of tarfile's default 16 KiB
+_TAR_COPY_BUFSIZE = 1024 * 1024
+
 
 class RepoID(NamedTuple):
     """The properties which uniquely identify a repository at a specific commit."""
@@ -156,6 +163,11 @@ def clone_as_tarball(url: str, ref: str, to_path: Path) -> None:
     :param ref: the revision to check out
     :param to_path: create the tarball at this path
     """
+    # A tarball of a specific commit never changes, there's no need to create it twice
+    if _COMMIT_ID_RE.fullmatch(ref) and to_path.exists():
+        log.debug("Tarball for %s at %s already exists: %s", url, ref, to_path)
+        return
+
     list_url = [url]
     # Fallback to `https` if cloning source via ssh fails
     if "ssh://" in url:
@@ -165,14 +177,7 @@ def clone_as_tarball(url: str, ref: str, to_path: Path) -> None:
         for url in list_url:
             log.debug("Cloning the Git repository from %s", url)
             try:
-                repo = Repo.clone_from(
-                    url,
-                    temp_dir,
-                    no_checkout=True,
-                    filter="blob:none",
-                    # Don't allow git to prompt for a username if we don't have access
-                    env={"GIT_TERMINAL_PROMPT": "0"},
-                )
+                repo = _clone_repo(url, ref, temp_dir)
             except Exception as ex:
                 log.warning(
                     "Failed cloning the Git repository from %s, ref: %s, exception: %s, exception-msg: %s",
@@ -185,14 +190,59 @@ def clone_as_tarball(url: str, ref: str, to_path: Path) -> None:
 
             _reset_git_head(repo, ref)
 
-            with tarfile.open(to_path, mode="w:gz") as archive:
+            # Write to a temporary file first, an existing to_path must always be complete.
+            # The name is unique per call in case the same tarball is being created concurrently.
+            partial_path = to_path.with_name(f"{to_path.name}.{Path(temp_dir).name}.part")
+            # copybufsize is passed through to TarFile, but typeshed doesn't know about it
+            with tarfile.open(  # type: ignore[call-overload]
+                partial_path,
+                mode="w:gz",
+                compresslevel=get_config().runtime.archive_compression_level,
+                copybufsize=_TAR_COPY_BUFSIZE,
+            ) as archive:
                 archive.add(repo.working_dir, "app")
 
+            partial_path.replace(to_path)
             return
 
     raise FetchError("Failed cloning the Git repository")
 
 
+def _clone_repo(url: str, ref: str, to_dir: str) -> Repo:
+    """Clone a git repository without checking out any files.
+
+    Blobs are never fetched upfront, they get downloaded lazily when checking out the ref.
+    If the ref is a branch or a tag, only the history leading to it is cloned. Commit ids
+    can't be cloned that way, those require the history of all the branches.
+
+    :param url: the URL of the repository
+    :param ref: the revision which will be checked out later
+    :param to_dir: an empty directory to clone the repository to
+    :return: the cloned repository
+    """
+    if not _COMMIT_ID_RE.fullmatch(ref):
+        try:
+            return Repo.clone_from(
+                url,
+                to_dir,
+                no_checkout=True,
+                filter="blob:none",
+                single_branch=True,
+                branch=ref,
+                env=_GIT_CLONE_ENV,
+            )
+        except git.GitCommandError:
+            log.debug("%s is not a branch or a tag, cloning all the branches", ref)
+
+    return Repo.clone_from(
+        url,
+        to_dir,
+        no_checkout=True,
+        filter="blob:none",
+        env=_GIT_CLONE_ENV,
+    )
+
+
 def _reset_git_head(repo: Repo, ref: str) -> None:
     try:
         repo.head.reference = repo.commit(ref)  # type: ignore # 'reference' is a weird property
@@ -12,6 +12,18 @@ from hermeto.core.type_aliases import StrPath
 
 log = logging.getLogger(__name__)
 
+# redirect stderr to stdout for easier evaluation/handling of a single stream
+_FORCED_SUBPROCESS_OPTIONS: dict[str, Any] = {
+    "stdout": subprocess.PIPE,
+    "stderr": subprocess.STDOUT,
+    "encoding": "utf-8",
+    "text": True,
+}
+
+_BUILDAH_INSPECT_CMD_ENTRYPOINT_FORMAT = (
+    "{{json .Docker.Config.Cmd}}\n{{json .Docker.Config.Entrypoint}}"
+)
+
 
 class ContainerEngine(ABC):
     """Abstract base class for container engines."""
@@ -31,17 +43,7 @@ class ContainerEngine(ABC):
         :rtype: Tuple
         """
         log.info("Run command: %s.", cmd)
-
-        # redirect stderr to stdout for easier evaluation/handling of a single stream
-        forced_options = {
-            "stdout": subprocess.PIPE,
-            "stderr": subprocess.STDOUT,
-            "encoding": "utf-8",
-            "text": True,
-        }
-
-        subprocess_kwargs.update(forced_options)
-        process = subprocess.run(cmd, **subprocess_kwargs)
+        process = subprocess.run(cmd, **subprocess_kwargs, **_FORCED_SUBPROCESS_OPTIONS)
 
         return process.stdout, process.returncode
 
@@ -96,16 +98,18 @@ class PodmanEngine(ContainerEngine):
         if flags is None:
             flags = []
 
-        if entrypoint:
-            flags.append(f"--entrypoint={entrypoint}")
-
-        image_cmd = [self.name, "run", "--rm", *flags, image] + cmd
+        entrypoint_flags = [f"--entrypoint={entrypoint}"] if entrypoint else []
+        image_cmd = [self.name, "run", "--rm", *flags, *entrypoint_flags, image, *cmd]
         return self._run_cmd(image_cmd)
 
 
 class BuildahEngine(ContainerEngine):
     """Buildah engine."""
 
+    def __init__(self) -> None:
+        """Initialize the cache of image configurations."""
+        self._image_configs: dict[str, tuple[list[str], list[str]]] = {}
+
     @property
     def name(self) -> str:
         """Get the name of the container engine."""
@@ -174,19 +178,46 @@ class BuildahEngine(ContainerEngine):
         return ["run", *flags, container_name, "--", *cmd]
 
     def _get_image_config(self, image: str) -> tuple[list[str], list[str]]:
+        """Get the cmd and entrypoint of the image, inspecting it only once."""
+        if image not in self._image_configs:
+            self._image_configs[image] = self._inspect_image_config(image)
+
+        return self._image_configs[image]
+
+    def _inspect_image_config(self, image: str) -> tuple[list[str], list[str]]:
         """Parse entrypoint and cmd from image's JSON configuration."""
-        output, exit_code = self._run_cmd(["buildah", "inspect", image])
+        # only render the two fields we need instead of the whole (potentially large) JSON
+        output, exit_code = self._run_cmd(
+            ["buildah", "inspect", "--format", _BUILDAH_INSPECT_CMD_ENTRYPOINT_FORMAT, image]
+        )
 
         if exit_code != 0:
             raise RuntimeError(f"Failed to inspect image {image}.")
 
-        parsed_output = json.loads(output)
-        docker_config = parsed_output.get("Docker", {}).get("config", {})
-        cmd = docker_config.get("Cmd", [])
-        entrypoint = docker_config.get("Entrypoint", [])
+        # stderr is merged into the output, the fields are always on the last two lines
+        *_, cmd_json, entrypoint_json = output.splitlines()
+        # null when the image doesn't set them
+        cmd = json.loads(cmd_json) or []
+        entrypoint = json.loads(entrypoint_json) or []
 
         return cmd, entrypoint
 
+    def build(self, context_dir: StrPath = ".", flags: list[str] | None = None) -> tuple[str, int]:
+        """Build container image, invalidating the cached image configurations."""
+        # the build may re-use the tag of an already inspected image
+        self._image_configs.clear()
+        return super().build(context_dir, flags)
+
+    def pull(self, image: str, flags: list[str] | None = None) -> tuple[str, int]:
+        """Pull container image, invalidating its cached configuration."""
+        self._image_configs.pop(image, None)
+        return super().pull(image, flags)
+
+    def rmi(self, image: str, flags: list[str] | None = None) -> tuple[str, int]:
+        """Remove container image and its cached configuration."""
+        self._image_configs.pop(image, None)
+        return super().rmi(image, flags)
+
     def run(
         self,
         image: str,
@@ -98,17 +98,15 @@ class ContainerImage:
         entrypoint: str | None = None,
         podman_flags: list[str] | None = None,
     ) -> tuple[str, int]:
-        if podman_flags is None:
-            podman_flags = []
-
-        podman_flags.extend(["-v", f"{tmp_path}:{tmp_path}:z"])
+        # don't modify the caller's list
+        flags = [*(podman_flags or ()), "-v", f"{tmp_path}:{tmp_path}:z"]
 
         for src, dest in mounts:
-            podman_flags.extend(["-v", f"{src}:{dest}:z"])
+            flags.extend(("-v", f"{src}:{dest}:z"))
         if net:
-            podman_flags.append(f"--net={net}")
+            flags.append(f"--net={net}")
 
-        return container_engine.run(self.repository, cmd, entrypoint, podman_flags)
+        return container_engine.run(self.repository, cmd, entrypoint, flags)
 
     def __exit__(self, exc_type: Any, exc_value: Any, exc_traceback: Any) -> None:
         output, exit_code = container_engine.rmi(self.repository)
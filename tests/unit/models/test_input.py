@@ -1,7 +1,6 @@
 import re
 from pathlib import Path
 from typing import Any, Literal, cast
-from unittest import mock
 
 import pydantic
 import pytest as pytest
@@ -25,6 +24,9 @@ from hermeto.core.models.input import (
 )
 from hermeto.core.rooted_path import RootedPath
 
+# building the validator for the whole union is expensive, do it only once
+PACKAGE_ADAPTER: pydantic.TypeAdapter[PackageInput] = pydantic.TypeAdapter(PackageInput)
+
 
 def test_parse_user_input() -> None:
     expect_error = re.compile(r"1 validation error for user input\ntype\n  Input should be 'gomod'")
@@ -32,288 +34,293 @@ def test_parse_user_input() -> None:
         parse_user_input(GomodPackageInput.model_validate, {"type": "go-package"})
 
 
-class TestPackageInput:
-    @pytest.mark.parametrize(
-        "input_data, expect_data",
-        [
-            (
-                {"type": "gomod"},
-                {"type": "gomod", "path": Path(".")},
-            ),
-            (
-                {"type": "gomod", "path": "./some/path"},
-                {"type": "gomod", "path": Path("some/path")},
-            ),
-            (
-                {"type": "pip"},
-                {
-                    "type": "pip",
-                    "path": Path("."),
-                    "requirements_files": None,
-                    "requirements_build_files": None,
-                    "allow_binary": False,
-                    "binary": None,
+VALID_PACKAGE_INPUTS = [
+    (
+        {"type": "gomod"},
+        {"type": "gomod", "path": Path(".")},
+    ),
+    (
+        {"type": "gomod", "path": "./some/path"},
+        {"type": "gomod", "path": Path("some/path")},
+    ),
+    (
+        {"type": "pip"},
+        {
+            "type": "pip",
+            "path": Path("."),
+            "requirements_files": None,
+            "requirements_build_files": None,
+            "allow_binary": False,
+            "binary": None,
+        },
+    ),
+    (
+        {
+            "type": "pip",
+            "requirements_files": ["reqs.txt"],
+            "requirements_build_files": [],
+            "allow_binary": True,
+        },
+        {
+            "type": "pip",
+            "path": Path("."),
+            "requirements_files": [Path("reqs.txt")],
+            "requirements_build_files": [],
+            "allow_binary": False,
+            "binary": {
+                "arch": BINARY_FILTER_ALL,
+                "os": BINARY_FILTER_ALL,
+                "py_impl": BINARY_FILTER_ALL,
+                "py_version": None,
+                "abi": BINARY_FILTER_ALL,
+                "platform": None,
+                "packages": BINARY_FILTER_ALL,
+            },
+        },
+    ),
+    (
+        {"type": "rpm"},
+        {
+            "type": "rpm",
+            "path": Path("."),
+            "options": None,
+            "include_summary_in_sbom": False,
+            "binary": None,
+        },
+    ),
+    (
+        {
+            "type": "rpm",
+            "options": {
+                "dnf": {
+                    "main": {"best": True, "debuglevel": 2},
+                    "foorepo": {"arch": "x86_64", "enabled": True},
+                }
+            },
+            "include_summary_in_sbom": False,
+        },
+        {
+            "type": "rpm",
+            "path": Path("."),
+            "options": {
+                "dnf": {
+                    "main": {"best": True, "debuglevel": 2},
+                    "foorepo": {"arch": "x86_64", "enabled": True},
                 },
-            ),
-            (
-                {
-                    "type": "pip",
-                    "requirements_files": ["reqs.txt"],
-                    "requirements_build_files": [],
-                    "allow_binary": True,
+                "ssl": None,
+            },
+            "include_summary_in_sbom": False,
+            "binary": None,
+        },
+    ),
+    (
+        {
+            "type": "rpm",
+            "options": {"ssl": {"ssl_verify": 0}},
+        },
+        {
+            "type": "rpm",
+            "path": Path("."),
+            "options": {
+                "dnf": None,
+                "ssl": {
+                    "ca_bundle": None,
+                    "client_cert": None,
+                    "client_key": None,
+                    "ssl_verify": False,
                 },
-                {
-                    "type": "pip",
-                    "path": Path("."),
-                    "requirements_files": [Path("reqs.txt")],
-                    "requirements_build_files": [],
-                    "allow_binary": False,
-                    "binary": {
-                        "arch": BINARY_FILTER_ALL,
-                        "os": BINARY_FILTER_ALL,
-                        "py_impl": BINARY_FILTER_ALL,
-                        "py_version": None,
-                        "abi": BINARY_FILTER_ALL,
-                        "platform": None,
-                        "packages": BINARY_FILTER_ALL,
-                    },
+            },
+            "include_summary_in_sbom": False,
+            "binary": None,
+        },
+    ),
+    (
+        {
+            "type": "rpm",
+            "options": {
+                "dnf": {
+                    "main": {"best": True, "debuglevel": 2},
+                    "foorepo": {"arch": "x86_64", "enabled": True},
                 },
-            ),
-            (
-                {"type": "rpm"},
-                {
-                    "type": "rpm",
-                    "path": Path("."),
-                    "options": None,
-                    "include_summary_in_sbom": False,
-                    "binary": None,
+                "ssl": {"ssl_verify": 0},
+            },
+        },
+        {
+            "type": "rpm",
+            "path": Path("."),
+            "options": {
+                "dnf": {
+                    "main": {"best": True, "debuglevel": 2},
+                    "foorepo": {"arch": "x86_64", "enabled": True},
                 },
-            ),
-            (
-                {
-                    "type": "rpm",
-                    "options": {
-                        "dnf": {
-                            "main": {"best": True, "debuglevel": 2},
-                            "foorepo": {"arch": "x86_64", "enabled": True},
-                        }
-                    },
-                    "include_summary_in_sbom": False,
-                },
-                {
-                    "type": "rpm",
-                    "path": Path("."),
-                    "options": {
-                        "dnf": {
-                            "main": {"best": True, "debuglevel": 2},
-                            "foorepo": {"arch": "x86_64", "enabled": True},
-                        },
-                        "ssl": None,
-                    },
-                    "include_summary_in_sbom": False,
-                    "binary": None,
-                },
-            ),
-            (
-                {
-                    "type": "rpm",
-                    "options": {"ssl": {"ssl_verify": 0}},
-                },
-                {
-                    "type": "rpm",
-                    "path": Path("."),
-                    "options": {
-                        "dnf": None,
-                        "ssl": {
-                            "ca_bundle": None,
-                            "client_cert": None,
-                            "client_key": None,
-                            "ssl_verify": False,
-                        },
-                    },
-                    "include_summary_in_sbom": False,
-                    "binary": None,
+                "ssl": {
+                    "ca_bundle": None,
+                    "client_cert": None,
+                    "client_key": None,
+                    "ssl_verify": False,
                 },
-            ),
-            (
-                {
-                    "type": "rpm",
-                    "options": {
-                        "dnf": {
-                            "main": {"best": True, "debuglevel": 2},
-                            "foorepo": {"arch": "x86_64", "enabled": True},
-                        },
-                        "ssl": {"ssl_verify": 0},
-                    },
-                },
-                {
-                    "type": "rpm",
-                    "path": Path("."),
-                    "options": {
-                        "dnf": {
-                            "main": {"best": True, "debuglevel": 2},
-                            "foorepo": {"arch": "x86_64", "enabled": True},
-                        },
-                        "ssl": {
-                            "ca_bundle": None,
-                            "client_cert": None,
-                            "client_key": None,
-                            "ssl_verify": False,
-                        },
-                    },
-                    "include_summary_in_sbom": False,
-                    "binary": None,
-                },
-            ),
-            pytest.param(
-                {
-                    "type": "pip",
-                    "binary": {
-                        "arch": "aarch64,armv7l",
-                        "os": "darwin,windows",
-                        "py_version": 39,
-                        "py_impl": "pp,jy",
-                        "abi": "cp,pp",
-                        "packages": "numpy,pandas",
-                    },
-                },
-                {
-                    "type": "pip",
-                    "path": Path("."),
-                    "requirements_files": None,
-                    "requirements_build_files": None,
-                    "allow_binary": False,
-                    "binary": {
-                        "arch": "aarch64,armv7l",
-                        "os": "darwin,windows",
-                        "py_impl": "pp,jy",
-                        "py_version": 39,
-                        "abi": "cp,pp",
-                        "platform": None,
-                        "packages": "numpy,pandas",
-                    },
-                },
-                id="pip_with_binary_filters",
-            ),
-            pytest.param(
-                {
-                    "type": "bundler",
-                    "binary": {
-                        "platform": "x86_64-linux,universal-darwin",
-                        "packages": "nokogiri,ffi",
-                    },
-                },
-                {
-                    "type": "bundler",
-                    "path": Path("."),
-                    "allow_binary": False,
-                    "binary": {
-                        "platform": "x86_64-linux,universal-darwin",
-                        "packages": "nokogiri,ffi",
-                    },
-                },
-                id="bundler_with_binary_filters",
-            ),
-            pytest.param(
-                {
-                    "type": "rpm",
-                    "binary": {"arch": "aarch64,ppc64le"},
-                },
-                {
-                    "type": "rpm",
-                    "path": Path("."),
-                    "options": None,
-                    "include_summary_in_sbom": False,
-                    "binary": {
-                        "arch": "aarch64,ppc64le",
-                    },
-                },
-                id="rpm_with_binary_filters",
-            ),
-        ],
-    )
+            },
+            "include_summary_in_sbom": False,
+            "binary": None,
+        },
+    ),
+    pytest.param(
+        {
+            "type": "pip",
+            "binary": {
+                "arch": "aarch64,armv7l",
+                "os": "darwin,windows",
+                "py_version": 39,
+                "py_impl": "pp,jy",
+                "abi": "cp,pp",
+                "packages": "numpy,pandas",
+            },
+        },
+        {
+            "type": "pip",
+            "path": Path("."),
+            "requirements_files": None,
+            "requirements_build_files": None,
+            "allow_binary": False,
+            "binary": {
+                "arch": "aarch64,armv7l",
+                "os": "darwin,windows",
+                "py_impl": "pp,jy",
+                "py_version": 39,
+                "abi": "cp,pp",
+                "platform": None,
+                "packages": "numpy,pandas",
+            },
+        },
+        id="pip_with_binary_filters",
+    ),
+    pytest.param(
+        {
+            "type": "bundler",
+            "binary": {
+                "platform": "x86_64-linux,universal-darwin",
+                "packages": "nokogiri,ffi",
+            },
+        },
+        {
+            "type": "bundler",
+            "path": Path("."),
+            "allow_binary": False,
+            "binary": {
+                "platform": "x86_64-linux,universal-darwin",
+                "packages": "nokogiri,ffi",
+            },
+        },
+        id="bundler_with_binary_filters",
+    ),
+    pytest.param(
+        {
+            "type": "rpm",
+            "binary": {"arch": "aarch64,ppc64le"},
+        },
+        {
+            "type": "rpm",
+            "path": Path("."),
+            "options": None,
+            "include_summary_in_sbom": False,
+            "binary": {
+                "arch": "aarch64,ppc64le",
+            },
+        },
+        id="rpm_with_binary_filters",
+    ),
+]
+
+INVALID_PACKAGE_INPUTS = [
+    pytest.param(
+        {},
+        re.compile(r"Unable to extract tag using discriminator 'type'"),
+        id="no_type_discrinator",
+    ),
+    pytest.param(
+        {"type": "go-package"},
+        re.compile(
+            r"Input tag 'go-package' found using 'type' does not match any of the expected tags: 'bundler', 'cargo', 'generic', 'gomod', 'npm', 'pip', 'rpm', 'yarn'"
+        ),
+        id="incorrect_type_tag",
+    ),
+    pytest.param(
+        {"type": "gomod", "path": "/absolute"},
+        re.compile(r"Value error, path must be relative: /absolute"),
+        id="path_not_relative",
+    ),
+    pytest.param(
+        {"type": "gomod", "path": ".."},
+        re.compile(r"Value error, path contains ..: .."),
+        id="gomod_path_references_parent_directory",
+    ),
+    pytest.param(
+        {"type": "gomod", "path": "weird/../subpath"},
+        re.compile(r"Value error, path contains ..: weird/../subpath"),
+        id="gomod_path_references_parent_directory_2",
+    ),
+    pytest.param(
+        {"type": "pip", "requirements_files": ["weird/../subpath"]},
+        re.compile(r"pip.requirements_files\n  Value error, path contains ..: weird/../subpath"),
+        id="pip_path_references_parent_directory",
+    ),
+    pytest.param(
+        {"type": "pip", "requirements_build_files": ["weird/../subpath"]},
+        re.compile(
+            r"pip.requirements_build_files\n  Value error, path contains ..: weird/../subpath"
+        ),
+        id="pip_path_references_parent_directory",
+    ),
+    pytest.param(
+        {"type": "pip", "requirements_files": None},
+        re.compile(r"none is not an allowed value"),
+        id="pip_no_requirements_files",
+    ),
+    pytest.param(
+        {"type": "pip", "requirements_build_files": None},
+        re.compile(r"none is not an allowed value"),
+        id="pip_no_requirements_build_files",
+    ),
+    pytest.param(
+        {"type": "rpm", "options": {"extra": "foo"}},
+        re.compile(r".*Extra inputs are not permitted \[type=extra_forbidden, input_value='foo'.*"),
+        id="rpm_extra_unknown_options",
+    ),
+    pytest.param(
+        {"type": "rpm", "options": {"dnf": "bad_type"}},
+        re.compile(r"Unexpected data type for 'options.dnf.bad_type' in input JSON"),
+        id="rpm_bad_type_for_dnf_namespace",
+    ),
+    pytest.param(
+        {"type": "rpm", "options": {"dnf": {"repo": "bad_type"}}},
+        re.compile(r"Unexpected data type for 'options.dnf.repo.bad_type' in input JSON"),
+        id="rpm_bad_type_for_dnf_options",
+    ),
+    pytest.param(
+        {"type": "pip", "binary": "invalid_string"},
+        re.compile(r"Input should be a valid dictionary"),
+        id="pip_binary_invalid_string",
+    ),
+    pytest.param(
+        {"type": "pip", "binary": {"unknown_field": "value"}},
+        re.compile(r"Extra inputs are not permitted"),
+        id="pip_binary_unknown_field",
+    ),
+]
+
+
+class TestPackageInput:
+    @pytest.mark.parametrize("input_data, expect_data", VALID_PACKAGE_INPUTS)
     def test_valid_packages(self, input_data: dict[str, Any], expect_data: dict[str, Any]) -> None:
-        adapter: pydantic.TypeAdapter[PackageInput] = pydantic.TypeAdapter(PackageInput)
-        package = cast(PackageInput, adapter.validate_python(input_data))
+        package = cast(PackageInput, PACKAGE_ADAPTER.validate_python(input_data))
         assert package.model_dump() == expect_data
 
-    @pytest.mark.parametrize(
-        "input_data, expect_error",
-        [
-            pytest.param(
-                {}, r"Unable to extract tag using discriminator 'type'", id="no_type_discrinator"
-            ),
-            pytest.param(
-                {"type": "go-package"},
-                r"Input tag 'go-package' found using 'type' does not match any of the expected tags: 'bundler', 'cargo', 'generic', 'gomod', 'npm', 'pip', 'rpm', 'yarn'",
-                id="incorrect_type_tag",
-            ),
-            pytest.param(
-                {"type": "gomod", "path": "/absolute"},
-                r"Value error, path must be relative: /absolute",
-                id="path_not_relative",
-            ),
-            pytest.param(
-                {"type": "gomod", "path": ".."},
-                r"Value error, path contains ..: ..",
-                id="gomod_path_references_parent_directory",
-            ),
-            pytest.param(
-                {"type": "gomod", "path": "weird/../subpath"},
-                r"Value error, path contains ..: weird/../subpath",
-                id="gomod_path_references_parent_directory_2",
-            ),
-            pytest.param(
-                {"type": "pip", "requirements_files": ["weird/../subpath"]},
-                r"pip.requirements_files\n  Value error, path contains ..: weird/../subpath",
-                id="pip_path_references_parent_directory",
-            ),
-            pytest.param(
-                {"type": "pip", "requirements_build_files": ["weird/../subpath"]},
-                r"pip.requirements_build_files\n  Value error, path contains ..: weird/../subpath",
-                id="pip_path_references_parent_directory",
-            ),
-            pytest.param(
-                {"type": "pip", "requirements_files": None},
-                r"none is not an allowed value",
-                id="pip_no_requirements_files",
-            ),
-            pytest.param(
-                {"type": "pip", "requirements_build_files": None},
-                r"none is not an allowed value",
-                id="pip_no_requirements_build_files",
-            ),
-            pytest.param(
-                {"type": "rpm", "options": {"extra": "foo"}},
-                r".*Extra inputs are not permitted \[type=extra_forbidden, input_value='foo'.*",
-                id="rpm_extra_unknown_options",
-            ),
-            pytest.param(
-                {"type": "rpm", "options": {"dnf": "bad_type"}},
-                r"Unexpected data type for 'options.dnf.bad_type' in input JSON",
-                id="rpm_bad_type_for_dnf_namespace",
-            ),
-            pytest.param(
-                {"type": "rpm", "options": {"dnf": {"repo": "bad_type"}}},
-                r"Unexpected data type for 'options.dnf.repo.bad_type' in input JSON",
-                id="rpm_bad_type_for_dnf_options",
-            ),
-            pytest.param(
-                {"type": "pip", "binary": "invalid_string"},
-                r"Input should be a valid dictionary",
-                id="pip_binary_invalid_string",
-            ),
-            pytest.param(
-                {"type": "pip", "binary": {"unknown_field": "value"}},
-                r"Extra inputs are not permitted",
-                id="pip_binary_unknown_field",
-            ),
-        ],
-    )
-    def test_invalid_packages(self, input_data: dict[str, Any], expect_error: str) -> None:
+    @pytest.mark.parametrize("input_data, expect_error", INVALID_PACKAGE_INPUTS)
+    def test_invalid_packages(
+        self, input_data: dict[str, Any], expect_error: re.Pattern[str]
+    ) -> None:
         with pytest.raises(pydantic.ValidationError, match=expect_error):
-            adapter: pydantic.TypeAdapter[PackageInput] = pydantic.TypeAdapter(PackageInput)
-            adapter.validate_python(input_data)
+            PACKAGE_ADAPTER.validate_python(input_data)
 
 
 class TestSSLOptions:
@@ -321,6 +328,10 @@ class TestSSLOptions:
     def patched_isfile(path: Path) -> bool:
         return str(path) == "pass"
 
+    @pytest.fixture(autouse=True)
+    def mock_isfile(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(Path, "is_file", self.patched_isfile)
+
     def test_defaults(self) -> None:
         ssl = SSLOptions()
         assert (
@@ -349,9 +360,8 @@ class TestSSLOptions:
         fail_opt = [i for i, v in data.items() if v == "fail"].pop()
         err = rf"Specified ssl auth file '{fail_opt}':'fail' is not a regular file."
 
-        with mock.patch.object(Path, "is_file", new=self.patched_isfile):
-            with pytest.raises(pydantic.ValidationError, match=err):
-                SSLOptions(**data)
+        with pytest.raises(pydantic.ValidationError, match=err):
+            SSLOptions(**data)
 
     @pytest.mark.parametrize(
         "data",
@@ -366,18 +376,25 @@ class TestSSLOptions:
     )
     def test_client_cert_and_key_both_provided(self, data: dict[str, str]) -> None:
         err = "When using client certificates, client_key and client_cert must both be provided."
-        with mock.patch.object(Path, "is_file", new=self.patched_isfile):
-            with pytest.raises(pydantic.ValidationError, match=err):
-                SSLOptions(**data)
+        with pytest.raises(pydantic.ValidationError, match=err):
+            SSLOptions(**data)
 
 
-class TestRequest:
-    def test_valid_request(self, tmp_path: Path) -> None:
-        tmp_path.joinpath("subpath").mkdir(exist_ok=True)
+@pytest.fixture(scope="class")
+def shared_tmp_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Return a source directory shared by all the tests in a class, which must only read it."""
+    tmp_path = tmp_path_factory.mktemp("request")
+    tmp_path.joinpath("subpath").mkdir()
+    tmp_path.joinpath("suspicious-symlink").symlink_to("..")
+    tmp_path.joinpath("not-a-dir").touch()
+    return tmp_path
+
 
+class TestRequest:
+    def test_valid_request(self, shared_tmp_path: Path) -> None:
         request = Request(
-            source_dir=str(tmp_path),
-            output_dir=str(tmp_path),
+            source_dir=str(shared_tmp_path),
+            output_dir=str(shared_tmp_path),
             packages=[
                 GomodPackageInput(type="gomod"),
                 GomodPackageInput(type="gomod", path="subpath"),
@@ -394,8 +411,8 @@ class TestRequest:
         )
 
         assert request.model_dump() == {
-            "source_dir": RootedPath(tmp_path),
-            "output_dir": RootedPath(tmp_path),
+            "source_dir": RootedPath(shared_tmp_path),
+            "output_dir": RootedPath(shared_tmp_path),
             "packages": [
                 {"type": "gomod", "path": Path(".")},
                 {"type": "gomod", "path": Path("subpath")},
@@ -416,9 +433,9 @@ class TestRequest:
         assert isinstance(request.source_dir, RootedPath)
         assert isinstance(request.output_dir, RootedPath)
 
-    def test_packages_properties(self, tmp_path: Path) -> None:
+    def test_packages_properties(self, shared_tmp_path: Path) -> None:
         packages = [{"type": "gomod"}, {"type": "npm"}, {"type": "pip"}, {"type": "rpm"}]
-        request = Request(source_dir=tmp_path, output_dir=tmp_path, packages=packages)
+        request = Request(source_dir=shared_tmp_path, output_dir=shared_tmp_path, packages=packages)
         assert request.gomod_packages == [GomodPackageInput(type="gomod")]
         assert request.npm_packages == [NpmPackageInput(type="npm")]
         assert request.pip_packages == [PipPackageInput(type="pip")]
@@ -436,12 +453,12 @@ class TestRequest:
         with pytest.raises(pydantic.ValidationError, match=expect_error):
             Request.model_validate(input_data)
 
-    def test_conflicting_packages(self, tmp_path: Path) -> None:
+    def test_conflicting_packages(self, shared_tmp_path: Path) -> None:
         expect_error = f"Value error, conflict by {('pip', Path('.'))}"
         with pytest.raises(pydantic.ValidationError, match=re.escape(expect_error)):
             Request(
-                source_dir=tmp_path,
-                output_dir=tmp_path,
+                source_dir=shared_tmp_path,
+                output_dir=shared_tmp_path,
                 packages=[
                     PipPackageInput(type="pip"),
                     PipPackageInput(type="pip", requirements_files=["foo.txt"]),
@@ -459,14 +476,13 @@ class TestRequest:
             ),
         ],
     )
-    def test_invalid_package_paths(self, path: str, expect_error: str, tmp_path: Path) -> None:
-        tmp_path.joinpath("suspicious-symlink").symlink_to("..")
-        tmp_path.joinpath("not-a-dir").touch()
-
+    def test_invalid_package_paths(
+        self, path: str, expect_error: str, shared_tmp_path: Path
+    ) -> None:
         with pytest.raises(pydantic.ValidationError, match=re.escape(expect_error)):
             Request(
-                source_dir=tmp_path,
-                output_dir=tmp_path,
+                source_dir=shared_tmp_path,
+                output_dir=shared_tmp_path,
                 packages=[GomodPackageInput(type="gomod", path=path)],
             )
 
@@ -5,6 +5,7 @@ import pytest
 import yaml
 
 import hermeto.core.config as config_module
+from hermeto.core.errors import InvalidInput
 
 DEFAULT_CONCURRENCY = config_module.RuntimeSettings.model_fields["concurrency_limit"].default
 
@@ -89,6 +90,17 @@ def test_env_overrides_default(monkeypatch: pytest.MonkeyPatch) -> None:
     assert config.runtime.concurrency_limit == override_concurrency
 
 
+@pytest.mark.parametrize("level", [-1, 10])
+def test_archive_compression_level_out_of_range(
+    level: int, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that an invalid gzip compression level is rejected."""
+    monkeypatch.setenv("HERMETO_RUNTIME__ARCHIVE_COMPRESSION_LEVEL", str(level))
+
+    with pytest.raises(InvalidInput, match="runtime -> archive_compression_level"):
+        config_module.get_config()
+
+
 @pytest.mark.parametrize("config_file_path", config_module.CONFIG_FILE_PATHS)
 def test_config_files_override_defaults(tmp_home_cwd: Path, config_file_path: str) -> None:
     """Test that each configured file path can override default values."""
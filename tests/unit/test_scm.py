@@ -105,6 +105,32 @@ def test_clone_as_tarball(golang_repo_path: Path, tmp_path: Path) -> None:
     assert compare.diff_files == ["go.mod"]
 
 
+def test_clone_as_tarball_tag(golang_repo_path: Path, tmp_path: Path) -> None:
+    to_path = tmp_path / "my-repo.tar.gz"
+
+    clone_as_tarball(f"file://{golang_repo_path}", "v2.0.0", to_path)
+
+    with tarfile.open(to_path) as tar:
+        if sys.version_info >= (3, 12):
+            tar.extractall(tmp_path / "my-repo", filter="fully_trusted")
+        else:
+            tar.extractall(tmp_path / "my-repo")
+
+    my_repo = Repo(tmp_path / "my-repo" / "app")
+    assert my_repo.commit().hexsha == Repo(golang_repo_path).commit("v2.0.0").hexsha
+    assert "v2.0.0" in my_repo.tags
+
+
+def test_clone_as_tarball_already_exists(tmp_path: Path) -> None:
+    to_path = tmp_path / "my-repo.tar.gz"
+    to_path.write_text("already cloned")
+
+    # the url doesn't matter, nothing gets cloned
+    clone_as_tarball("file:///no/such/directory", INITIAL_COMMIT, to_path)
+
+    assert to_path.read_text() == "already cloned"
+
+
 def test_clone_as_tarball_wrong_url(tmp_path: Path) -> None:
     with pytest.raises(FetchError, match="Failed cloning the Git repository"):
         clone_as_tarball("file:///no/such/directory", INITIAL_COMMIT, tmp_path / "my-repo.tar.gz")